@@ -1,19 +1,38 @@
 @ECHO OFF
 :: This batch file builds a Windows binary executable
+:: Pass --clean to discard PyInstaller's cache and rebuild from scratch
+:: Pass --dev for a faster --onedir build in dist\iRSCG instead of a single exe
+
+:: Parse command line arguments
+SET CLEAN=
+SET BUNDLE=--onefile
+SET DIST=dist
+:parse_args
+IF "%~1"=="" GOTO args_parsed
+IF /I "%~1"=="--clean" SET CLEAN=--clean
+IF /I "%~1"=="--dev" SET BUNDLE=--onedir
+IF /I "%~1"=="--dev" SET DIST=dist\iRSCG
+SHIFT
+GOTO parse_args
+:args_parsed
+
+:: Run from the directory containing this script, whatever the caller's is
+PUSHD "%~dp0"
+
 ECHO Building binary. Please wait...
 :: Import pywinauto before building to avoid missing library error
-python -c "import pywinauto"
-:: Build new binary
-pyinstaller --noconfirm --log-level=FATAL --noconsole --onefile --hidden-import=comtypes.gen.UIAutomationClient --name=iRSCG main.py
+:: (skipped when the generated comtypes UIAutomationClient module already exists)
+python -c "import comtypes.gen.UIAutomationClient" 2>NUL || python -c "import pywinauto"
+:: Build new binary, reusing the analysis cache in build unless cleaning
+pyinstaller --noconfirm %CLEAN% --workpath=build --log-level=FATAL --noconsole %BUNDLE% --hidden-import=comtypes.gen.UIAutomationClient --name=iRSCG main.py
+
+ECHO Copying files to %DIST%...
+:: Copy settings.ini, logging.json and tooltips_text.json to dist
+ROBOCOPY . %DIST% settings.ini logging.json tooltips_text.json /NFL /NDL /NJH /NJS /NP
+IF %ERRORLEVEL% GEQ 8 ECHO Failed to copy settings files to %DIST%.
+:: Copy README.md and LICENSE to dist
+ROBOCOPY .. %DIST% README.md LICENSE /NFL /NDL /NJH /NJS /NP
+IF %ERRORLEVEL% GEQ 8 ECHO Failed to copy documentation to %DIST%.
 
-ECHO Copying files to dist...
-:: Copy settings.ini to dist
-COPY settings.ini dist\settings.ini
-:: Copy logging.json to dist
-COPY logging.json dist\logging.json
-:: Copy README.md to dist
-COPY ..\README.md dist\README.md
-:: Copy LICENSE to dist
-COPY ..\LICENSE dist\LICENSE
-:: Copy tooltips.json to dist
-COPY tooltips_text.json dist\tooltips_text.json
\ No newline at end of file
+:: Return to the caller's directory
+POPD
\ No newline at end of file
@@ -1,14 +1,51 @@
 import configparser
+import functools
+import importlib
+import io
 import json
 import logging
+import os
+import threading
 import tkinter as tk
 from tkinter import ttk
 
-from core import generator
 from core import tooltip
 
 logger = logging.getLogger(__name__)
 
+# Grid options shared by the widgets in the main window
+GRID_PADDING = {"padx": 5, "pady": 5}
+GRID_W = {"sticky": "w", **GRID_PADDING}
+GRID_E = {"sticky": "e", **GRID_PADDING}
+GRID_EW = {"sticky": "ew", **GRID_PADDING}
+GRID_NESW = {"sticky": "nesw", **GRID_PADDING}
+
+# Settings widgets for each frame, one row each, as tuples of:
+# (kind, setting in settings.ini, label text, widget width, grid columnspan)
+SC_TYPES_SPEC = (
+    ("check", "random", "Random", None, 1),
+    ("spinbox", "random_max_occ", "Maximum occurences", 5, 1),
+    ("entry", "random_prob", "Probability", 7, 1),
+    ("message", "random_message", None, 32, 2),
+    ("separator", None, None, None, 2),
+    ("check", "stopped", "Cars stopped on track", None, 1),
+    ("spinbox", "stopped_min", "Minimum to trigger", 5, 1),
+    ("message", "stopped_message", None, 32, 2),
+    ("separator", None, None, None, 2),
+    ("check", "off", "Cars off track", None, 1),
+    ("spinbox", "off_min", "Minimum to trigger", 5, 1),
+    ("message", "off_message", None, 32, 2),
+)
+GENERAL_SPEC = (
+    ("entry", "max_safety_cars", "Maximum safety cars", 5, 1),
+    ("entry", "start_minute", "Earliest possible minute", 5, 1),
+    ("entry", "end_minute", "Latest possible minute", 5, 1),
+    ("entry", "min_time_between", "Minimum minutes between", 5, 1),
+    ("entry", "laps_under_sc", "Laps under safety car", 5, 1),
+    ("check", "wave_arounds", "Automatic wave arounds", None, 2),
+    ("entry", "laps_before_wave_arounds", "Laps before wave arounds", 5, 1),
+)
+
 class App(tk.Tk):
     """Main application window for the safety car generator."""
     def __init__(self):
@@ -20,20 +57,22 @@ class App(tk.Tk):
         logger.info("Initializing main application window")
         super().__init__()
 
-        # Tooltips text
-        self.load_tooltips_text()
-
         # Load settings from config file
         logger.info("Loading settings from settings.ini")
-        self.settings = configparser.ConfigParser()
+        self.settings = configparser.RawConfigParser()
         self.settings.read("settings.ini")
 
         # Set window properties
         self.title("iRacing Safety Car Generator")
 
-        # Create generator object
-        self.generator = generator.Generator(self)
-        self.shutdown_event = self.generator.shutdown_event
+        # Generator object, created the first time Run is pressed
+        self.generator = None
+
+        # Variables holding the value of each setting, by setting name
+        self.setting_vars = {}
+
+        # Tooltips of the widgets, shown from one set of window bindings
+        self.tooltips = tooltip.ToolTipManager(self)
 
         # Set handler for closing main window event
         self.protocol('WM_DELETE_WINDOW', self.handle_delete_window)
@@ -41,13 +80,39 @@ class App(tk.Tk):
         # Create widgets
         self._create_widgets()
 
-    def load_tooltips_text(self):
+        # Import the generator module in the background while the window is
+        # shown, so the first Run doesn't wait on the iRacing SDK and pywinauto.
+        # Importing pywinauto sets the process DPI awareness, which main.py has
+        # already set the same way, so the window isn't rescaled when it does
+        threading.Thread(
+            target=importlib.import_module,
+            args=("core.generator",),
+            daemon=True
+        ).start()
+
+    @functools.cached_property
+    def tooltips_text(self):
+        """Tooltips text, loaded from file the first time a tooltip is shown.
+
+        Args:
+            None
+        """
         logger.info("Loading tooltips text")
         try:
-            with open("tooltips_text.json", "r") as file:
-                self.tooltips_text = json.load(file)
-        except Exception as e:
-            self.tooltips_text = {}
+            with open("tooltips_text.json", "rb") as file:
+                return json.loads(file.read())
+        except (OSError, ValueError):
+            logger.warning("Could not load tooltips text", exc_info=True)
+            return {}
+
+    def _add_tooltip(self, key, *widgets):
+        """Register a tooltip for widgets, looking up its text when shown.
+
+        Args:
+            key (str): The key of the tooltip in tooltips_text.json
+            *widgets: The widgets to show the tooltip for
+        """
+        self.tooltips.register(lambda: self.tooltips_text.get(key), *widgets)
 
     def handle_delete_window(self):
         """ Event handler to trigger shutdown_event and destroy the main window
@@ -56,7 +121,8 @@ class App(tk.Tk):
             None
         """
         logger.info("Closing main application window")
-        self.shutdown_event.set()
+        if self.generator is not None:
+            self.generator.shutdown_event.set()
         self.destroy()
 
     def _create_widgets(self):
@@ -67,645 +133,118 @@ class App(tk.Tk):
         """
         logger.info("Creating widgets for main application window")
 
-        # Configure
-        logger.debug("Configuring main application window")
-        self.columnconfigure(0, weight=1)
-        self.columnconfigure(1, weight=1)
-        self.rowconfigure(0, weight=1)
-        self.rowconfigure(1, weight=1)
+        # Read the settings into a plain dict, so widgets can be created with
+        # their values instead of filling them in afterwards
+        settings = dict(self.settings["settings"])
+
+        # Configure both columns and rows at once, as Tk takes a list of indices
+        self.columnconfigure((0, 1), weight=1)
+        self.rowconfigure((0, 1), weight=1)
 
         # Create Safety Car Types frame
-        logger.debug("Creating Safety Car Types frame")
         self.frm_sc_types = ttk.LabelFrame(self, text="Safety Car Types")
-        self.frm_sc_types.grid(
-            row=0,
-            column=0,
-            rowspan=2,
-            sticky="nesw",
-            padx=5,
-            pady=5
-        )
-
-        # Create variable to hold the current row in the frame
-        sc_types_row = 0
-
-        # Create random checkbox
-        logger.debug("Creating random checkbox")
-        self.var_random = tk.IntVar()
-        self.var_random.set(1)
-        self.chk_random = ttk.Checkbutton(
-            self.frm_sc_types,
-            text="Random",
-            variable=self.var_random
-        )
-        self.chk_random.grid(
-            row=sc_types_row,
-            column=0,
-            sticky="w",
-            padx=5,
-            pady=5
-        )
-        tooltip.CreateToolTip(self.chk_random, self.tooltips_text.get("random"))
-        sc_types_row += 1
-
-        # Create maximum occurences spinbox
-        logger.debug("Creating maximum occurences spinbox")
-        self.lbl_random_max_occ = ttk.Label(
-            self.frm_sc_types,
-            text="Maximum occurences"
-        )
-        self.lbl_random_max_occ.grid(
-            row=sc_types_row,
-            column=0,
-            sticky="w",
-            padx=5,
-            pady=5
-        )
-        self.spn_random_max_occ = ttk.Spinbox(
-            self.frm_sc_types,
-            from_=0,
-            to=100,
-            width=5
-        )
-        self.spn_random_max_occ.grid(
-            row=sc_types_row,
-            column=1,
-            sticky="e",
-            padx=5,
-            pady=5
-        )
-        tooltip.CreateToolTip(
-            self.lbl_random_max_occ,
-            self.tooltips_text.get("random_max_occ")
-        )
-        tooltip.CreateToolTip(
-            self.spn_random_max_occ,
-            self.tooltips_text.get("random_max_occ")
-        )
-        sc_types_row += 1
-
-        # Create probability entry
-        logger.debug("Creating probability entry")
-        self.lbl_random_prob = ttk.Label(
-            self.frm_sc_types,
-            text="Probability"
-        )
-        self.lbl_random_prob.grid(
-            row=sc_types_row,
-            column=0,
-            sticky="w",
-            padx=5,
-            pady=5
-        )
-        self.ent_random_prob = ttk.Entry(self.frm_sc_types, width=7)
-        self.ent_random_prob.grid(
-            row=sc_types_row,
-            column=1,
-            sticky="e",
-            padx=5,
-            pady=5
-        )
-        tooltip.CreateToolTip(
-            self.lbl_random_prob,
-            self.tooltips_text.get("random_prob")
-        )
-        tooltip.CreateToolTip(
-            self.ent_random_prob,
-            self.tooltips_text.get("random_prob")
-        )
-        sc_types_row += 1
-
-        # Create message entry
-        logger.debug("Creating message entry")
-        self.ent_random_message = ttk.Entry(
-            self.frm_sc_types,
-            width=32
-        )
-        self.ent_random_message.grid(
-            row=sc_types_row,
-            column=0,
-            columnspan=2,
-            sticky="w",
-            padx=5,
-            pady=5
-        )
-        tooltip.CreateToolTip(
-            self.ent_random_message,
-            self.tooltips_text.get("message")
-        )
-        sc_types_row += 1
-
-        # Create horizontal separator
-        logger.debug("Creating horizontal separator")
-        separator = ttk.Separator(self.frm_sc_types, orient="horizontal")
-        separator.grid(
-            row=sc_types_row,
-            column=0,
-            columnspan=2,
-            sticky="ew",
-            padx=5,
-            pady=5
-        )
-        sc_types_row += 1
-
-        # Create cars stopped on track checkbox
-        logger.debug("Creating cars stopped on track checkbox")
-        self.var_stopped = tk.IntVar()
-        self.var_stopped.set(1)
-        self.chk_stopped = ttk.Checkbutton(
-            self.frm_sc_types,
-            text="Cars stopped on track",
-            variable=self.var_stopped
-        )
-        self.chk_stopped.grid(
-            row=sc_types_row,
-            column=0,
-            sticky="w",
-            padx=5,
-            pady=5
-        )
-        tooltip.CreateToolTip(
-            self.chk_stopped,
-            self.tooltips_text.get("stopped")
-        )
-        sc_types_row += 1
-
-        # Create minimum to trigger spinbox
-        logger.debug("Creating minimum to trigger spinbox")
-        self.lbl_stopped_min = ttk.Label(
-            self.frm_sc_types,
-            text="Minimum to trigger"
-        )
-        self.lbl_stopped_min.grid(
-            row=sc_types_row,
-            column=0,
-            sticky="w",
-            padx=5,
-            pady=5
-        )
-        self.spn_stopped_min = ttk.Spinbox(
-            self.frm_sc_types,
-            from_=0,
-            to=100,
-            width=5
-        )
-        self.spn_stopped_min.grid(
-            row=sc_types_row,
-            column=1,
-            sticky="e",
-            padx=5,
-            pady=5
-        )
-        tooltip.CreateToolTip(
-            self.lbl_stopped_min,
-            self.tooltips_text.get("stopped_min")
-        )
-        tooltip.CreateToolTip(
-            self.spn_stopped_min,
-            self.tooltips_text.get("stopped_min")
-        )
-        sc_types_row += 1
-
-        # Create message entry
-        logger.debug("Creating message entry")
-        self.ent_stopped_message = ttk.Entry(
-            self.frm_sc_types,
-            width=32
-        )
-        self.ent_stopped_message.grid(
-            row=sc_types_row,
-            column=0,
-            columnspan=2,
-            sticky="w",
-            padx=5,
-            pady=5
-        )
-        tooltip.CreateToolTip(
-            self.ent_stopped_message,
-            self.tooltips_text.get("message")
-        )
-        sc_types_row += 1
-
-        # Create horizontal separator
-        logger.debug("Creating horizontal separator")
-        separator = ttk.Separator(self.frm_sc_types, orient="horizontal")
-        separator.grid(
-            row=sc_types_row,
-            column=0,
-            columnspan=2,
-            sticky="ew",
-            padx=5,
-            pady=5
-        )
-        sc_types_row += 1
-
-        # Create cars off track checkbox
-        logger.debug("Creating cars off track checkbox")
-        self.var_off = tk.IntVar()
-        self.var_off.set(1)
-        self.chk_off = ttk.Checkbutton(
-            self.frm_sc_types,
-            text="Cars off track",
-            variable=self.var_off
-        )
-        self.chk_off.grid(
-            row=sc_types_row,
-            column=0,
-            sticky="w",
-            padx=5,
-            pady=5
-        )
-        tooltip.CreateToolTip(self.chk_off, self.tooltips_text.get("off"))
-        sc_types_row += 1
-
-        # Create minimum to trigger spinbox
-        logger.debug("Creating minimum to trigger spinbox")
-        self.lbl_off_min = ttk.Label(
-            self.frm_sc_types,
-            text="Minimum to trigger"
-        )
-        self.lbl_off_min.grid(
-            row=sc_types_row,
-            column=0,
-            sticky="w",
-            padx=5,
-            pady=5
-        )
-        self.spn_off_min = ttk.Spinbox(
-            self.frm_sc_types,
-            from_=0,
-            to=100,
-            width=5
-        )
-        self.spn_off_min.grid(
-            row=sc_types_row,
-            column=1,
-            sticky="e",
-            padx=5,
-            pady=5
-        )
-        tooltip.CreateToolTip(
-            self.lbl_off_min,
-            self.tooltips_text.get("off_min")
-        )
-        tooltip.CreateToolTip(
-            self.spn_off_min,
-            self.tooltips_text.get("off_min")
-        )
-        sc_types_row += 1
-
-        # Create message entry
-        logger.debug("Creating message entry")
-        self.ent_off_message = ttk.Entry(
-            self.frm_sc_types,
-            width=32
-        )
-        self.ent_off_message.grid(
-            row=sc_types_row,
-            column=0,
-            columnspan=2,
-            sticky="w",
-            padx=5,
-            pady=5
-        )
-        tooltip.CreateToolTip(
-            self.ent_off_message,
-            self.tooltips_text.get("message")
-        )
+        self.frm_sc_types.grid(row=0, column=0, rowspan=2, **GRID_NESW)
+        self._build_settings_frame(self.frm_sc_types, SC_TYPES_SPEC, settings)
 
         # Create General frame
-        logger.debug("Creating General frame")
         self.frm_general = ttk.LabelFrame(self, text="General")
-        self.frm_general.grid(row=0, column=1, sticky="nesw", padx=5, pady=5)
-
-        # Create variable to hold the current row in the frame
-        general_row = 0
-
-        # Create maximum safety cars entry
-        logger.debug("Creating maximum safety cars entry")
-        self.lbl_max_safety_cars = ttk.Label(
-            self.frm_general,
-            text="Maximum safety cars"
-        )
-        self.lbl_max_safety_cars.grid(
-            row=general_row,
-            column=0,
-            sticky="w",
-            padx=5,
-            pady=5
-        )
-        self.ent_max_safety_cars = ttk.Entry(self.frm_general, width=5)
-        self.ent_max_safety_cars.grid(
-            row=general_row,
-            column=1,
-            sticky="e",
-            padx=5,
-            pady=5
-        )
-        tooltip.CreateToolTip(
-            self.lbl_max_safety_cars,
-            self.tooltips_text.get("max_safety_cars")
-        )
-        tooltip.CreateToolTip(
-            self.ent_max_safety_cars,
-            self.tooltips_text.get("max_safety_cars")
-        )
-        general_row += 1
-
-        # Create earliest possible minute entry
-        logger.debug("Creating earliest possible minute entry")
-        self.lbl_start_minute = ttk.Label(
-            self.frm_general,
-            text="Earliest possible minute"
-        )
-        self.lbl_start_minute.grid(
-            row=general_row,
-            column=0,
-            sticky="w",
-            padx=5,
-            pady=5
-        )
-        self.ent_start_minute = ttk.Entry(self.frm_general, width=5)
-        self.ent_start_minute.grid(
-            row=general_row,
-            column=1,
-            sticky="e",
-            padx=5,
-            pady=5
-        )
-        tooltip.CreateToolTip(
-            self.lbl_start_minute,
-            self.tooltips_text.get("start_minute")
-        )
-        tooltip.CreateToolTip(
-            self.ent_start_minute,
-            self.tooltips_text.get("start_minute")
-        )
-        general_row += 1
-
-        # Create latest possible minute entry
-        logger.debug("Creating latest possible minute entry")
-        self.lbl_end_minute = ttk.Label(
-            self.frm_general,
-            text="Latest possible minute"
-        )
-        self.lbl_end_minute.grid(
-            row=general_row,
-            column=0,
-            sticky="w",
-            padx=5,
-            pady=5
-        )
-        self.ent_end_minute = ttk.Entry(self.frm_general, width=5)
-        self.ent_end_minute.grid(
-            row=general_row,
-            column=1,
-            sticky="e",
-            padx=5,
-            pady=5
-        )
-        tooltip.CreateToolTip(
-            self.lbl_end_minute,
-            self.tooltips_text.get("end_minute")
-        )
-        tooltip.CreateToolTip(
-            self.ent_end_minute,
-            self.tooltips_text.get("end_minute")
-        )
-        general_row += 1
-
-        # Create minimum minutes between entry
-        logger.debug("Creating minimum minutes between entry")
-        self.lbl_min_time_between = ttk.Label(
-            self.frm_general,
-            text="Minimum minutes between"
-        )
-        self.lbl_min_time_between.grid(
-            row=general_row,
-            column=0,
-            sticky="w",
-            padx=5,
-            pady=5
-        )
-        self.ent_min_time_between = ttk.Entry(self.frm_general, width=5)
-        self.ent_min_time_between.grid(
-            row=general_row,
-            column=1,
-            sticky="e",
-            padx=5,
-            pady=5
-        )
-        tooltip.CreateToolTip(
-            self.lbl_min_time_between,
-            self.tooltips_text.get("min_time_between")
-        )
-        tooltip.CreateToolTip(
-            self.ent_min_time_between,
-            self.tooltips_text.get("min_time_between")
-        )
-        general_row += 1
-
-        # Create laps under safety car entry
-        logger.debug("Creating laps under safety car entry")
-        self.lbl_laps_under_sc = ttk.Label(
-            self.frm_general,
-            text="Laps under safety car"
-        )
-        self.lbl_laps_under_sc.grid(
-            row=general_row,
-            column=0,
-            sticky="w",
-            padx=5,
-            pady=5
-        )
-        self.ent_laps_under_sc = ttk.Entry(self.frm_general, width=5)
-        self.ent_laps_under_sc.grid(
-            row=general_row,
-            column=1,
-            sticky="e",
-            padx=5,
-            pady=5
-        )
-        tooltip.CreateToolTip(
-            self.lbl_laps_under_sc,
-            self.tooltips_text.get("laps_under_sc")
-        )
-        tooltip.CreateToolTip(
-            self.ent_laps_under_sc,
-            self.tooltips_text.get("laps_under_sc")
-        )
-        general_row += 1
-
-        # Create wave arounds checkbox
-        logger.debug("Creating automatic wave arounds checkbox")
-        self.var_wave_arounds = tk.IntVar()
-        self.var_wave_arounds.set(1)
-        self.chk_wave_arounds = ttk.Checkbutton(
-            self.frm_general,
-            text="Automatic wave arounds",
-            variable=self.var_wave_arounds
-        )
-        self.chk_wave_arounds.grid(
-            row=general_row,
-            column=0,
-            columnspan=2,
-            sticky="w",
-            padx=5,
-            pady=5
-        )
-        tooltip.CreateToolTip(
-            self.chk_wave_arounds,
-            self.tooltips_text.get("wave_arounds")
-        )
-        general_row += 1
-
-        # Create laps before wave arounds entry
-        logger.debug("Creating laps before wave arounds entry")
-        self.lbl_laps_before_wave_arounds = ttk.Label(
-            self.frm_general,
-            text="Laps before wave arounds"
-        )
-        self.lbl_laps_before_wave_arounds.grid(
-            row=general_row,
-            column=0,
-            sticky="w",
-            padx=5,
-            pady=5
-        )
-        self.ent_laps_before_wave_arounds = ttk.Entry(self.frm_general, width=5)
-        self.ent_laps_before_wave_arounds.grid(
-            row=general_row,
-            column=1,
-            sticky="e",
-            padx=5,
-            pady=5
-        )
-        tooltip.CreateToolTip(
-            self.lbl_laps_before_wave_arounds,
-            self.tooltips_text.get("laps_before_wave_arounds")
-        )
-        tooltip.CreateToolTip(
-            self.ent_laps_before_wave_arounds,
-            self.tooltips_text.get("laps_before_wave_arounds")
-        )
+        self.frm_general.grid(row=0, column=1, **GRID_NESW)
+        self._build_settings_frame(self.frm_general, GENERAL_SPEC, settings)
 
         # Create Controls frame
-        logger.debug("Creating Controls frame")
         self.frm_controls = ttk.Frame(self)
-        self.frm_controls.grid(row=1, column=1, sticky="nesw", padx=5, pady=5)
+        self.frm_controls.grid(row=1, column=1, **GRID_NESW)
         self.frm_controls.columnconfigure(0, weight=1)
 
-        # Create variable to hold the current row in the frame
-        controls_row = 0
-
         # Create save settings button
-        logger.debug("Creating save settings button")
         self.btn_save_settings = ttk.Button(
             self.frm_controls,
             text="Save Settings",
             command=self._save_settings
         )
-        self.btn_save_settings.grid(
-            row=controls_row,
-            column=0,
-            sticky="ew",
-            padx=5,
-            pady=5
-        )
-        controls_row += 1
 
         # Create run button
-        logger.debug("Creating run button")
         self.btn_run = ttk.Button(
             self.frm_controls,
             text="Run",
             command=self._save_and_run
         )
-        self.btn_run.grid(
-            row=controls_row,
-            column=0,
-            sticky="ew",
-            padx=5,
-            pady=5
-        )
-        controls_row += 1
 
         # Create status label
-        logger.debug("Creating status label")
         self.lbl_status = ttk.Label(
             self.frm_controls,
             text="Ready\n",
             anchor=tk.CENTER
         )
-        self.lbl_status.grid(
-            row=controls_row,
-            column=0,
-            sticky="ew",
-            padx=5,
-            pady=5
-        )
 
-        # Fill in the widgets with the settings from the config file
-        logger.debug("Filling in widgets with settings from config file")
-        self.var_random.set(self.settings["settings"].getboolean("random"))
-        self.spn_random_max_occ.delete(0, "end")
-        self.spn_random_max_occ.insert(
-            0,
-            self.settings["settings"]["random_max_occ"]
-        )
-        self.ent_random_prob.delete(0, "end")
-        self.ent_random_prob.insert(0, self.settings["settings"]["random_prob"])
-        self.ent_random_message.delete(0, "end")
-        self.ent_random_message.insert(
-            0,
-            self.settings["settings"]["random_message"]
-        )
-        self.var_stopped.set(self.settings["settings"].getboolean("stopped"))
-        self.spn_stopped_min.delete(0, "end")
-        self.spn_stopped_min.insert(
-            0,
-            self.settings["settings"]["stopped_min"]
-        )
-        self.ent_stopped_message.delete(0, "end")
-        self.ent_stopped_message.insert(
-            0,
-            self.settings["settings"]["stopped_message"]
-        )
-        self.var_off.set(self.settings["settings"].getboolean("off"))
-        self.spn_off_min.delete(0, "end")
-        self.spn_off_min.insert(0, self.settings["settings"]["off_min"])
-        self.ent_off_message.delete(0, "end")
-        self.ent_off_message.insert(0, self.settings["settings"]["off_message"])
-        self.ent_max_safety_cars.delete(0, "end")
-        self.ent_max_safety_cars.insert(
-            0,
-            self.settings["settings"]["max_safety_cars"]
-        )
-        self.ent_start_minute.delete(0, "end")
-        self.ent_start_minute.insert(
-            0,
-            self.settings["settings"]["start_minute"]
-        )
-        self.ent_end_minute.delete(0, "end")
-        self.ent_end_minute.insert(0, self.settings["settings"]["end_minute"])
-        self.ent_min_time_between.delete(0, "end")
-        self.ent_min_time_between.insert(
-            0,
-            self.settings["settings"]["min_time_between"]
-        )
-        self.ent_laps_under_sc.delete(0, "end")
-        self.ent_laps_under_sc.insert(
-            0,
-            self.settings["settings"]["laps_under_sc"]
-        )
-        self.var_wave_arounds.set(
-            self.settings["settings"].getboolean("wave_arounds")
-        )
-        self.ent_laps_before_wave_arounds.delete(0, "end")
-        self.ent_laps_before_wave_arounds.insert(
-            0,
-            self.settings["settings"]["laps_before_wave_arounds"]
-        )
+        # Stack the controls, one per row
+        controls = (self.btn_save_settings, self.btn_run, self.lbl_status)
+        for row, widget in enumerate(controls):
+            widget.grid(row=row, column=0, **GRID_EW)
+
+    def _build_settings_frame(self, frame, spec, settings):
+        """Create the settings widgets in a frame, one row per spec entry.
+
+        Only the variables holding the settings are kept, in setting_vars, as
+        the widgets themselves aren't needed after they are created.
+
+        Args:
+            frame: The frame to create the widgets in
+            spec (tuple): Rows of (kind, setting, text, width, columnspan)
+            settings (dict): The current settings, to fill in the widgets
+        """
+        for row, (kind, key, text, width, columnspan) in enumerate(spec):
+            # Create horizontal separator
+            if kind == "separator":
+                separator = ttk.Separator(frame, orient="horizontal")
+                separator.grid(
+                    row=row, column=0, columnspan=columnspan, **GRID_EW
+                )
+                continue
+
+            # Create checkbox, checked if the setting is true, holding the
+            # setting as "1" or "0" as the generator reads it
+            if kind == "check":
+                checked = self.settings.BOOLEAN_STATES[settings[key].lower()]
+                var = tk.StringVar(value="1" if checked else "0")
+                chk = ttk.Checkbutton(
+                    frame,
+                    text=text,
+                    variable=var,
+                    onvalue="1",
+                    offvalue="0"
+                )
+                chk.grid(row=row, column=0, columnspan=columnspan, **GRID_W)
+                self._add_tooltip(key, chk)
+                self.setting_vars[key] = var
+                continue
+
+            # Create variable holding the setting, filled in from the file
+            var = tk.StringVar(value=settings[key])
+            self.setting_vars[key] = var
+
+            # Create message entry, which has no label
+            if kind == "message":
+                ent = ttk.Entry(frame, width=width, textvariable=var)
+                ent.grid(row=row, column=0, columnspan=columnspan, **GRID_W)
+                self._add_tooltip("message", ent)
+                continue
+
+            # Create label with a spinbox or entry next to it
+            lbl = ttk.Label(frame, text=text)
+            lbl.grid(row=row, column=0, **GRID_W)
+            if kind == "spinbox":
+                widget = ttk.Spinbox(
+                    frame,
+                    from_=0,
+                    to=100,
+                    width=width,
+                    textvariable=var
+                )
+            else:
+                widget = ttk.Entry(frame, width=width, textvariable=var)
+            widget.grid(row=row, column=1, **GRID_E)
+            self._add_tooltip(key, lbl, widget)
 
     def _save_and_run(self):
         """Save the settings to the config file and run the generator.
@@ -714,7 +253,49 @@ class App(tk.Tk):
             None
         """
         self._save_settings()
-        self.generator.run()
+
+        # Create the generator on first run, only importing it (and with it
+        # the iRacing SDK and pywinauto) once it's actually needed
+        if self.generator is None:
+            from core import generator
+            self.generator = generator.Generator(self)
+
+        # Copy the settings for the generator here on the UI thread, as saving
+        # replaces the settings section and mustn't overlap with the copy
+        self.generator.update_settings()
+
+        # Connect to iRacing in the background so the window stays responsive,
+        # with the buttons disabled until the generator has started, so the
+        # settings can't be saved meanwhile
+        self._set_buttons_state(["disabled"])
+        threading.Thread(target=self._run_generator, daemon=True).start()
+
+    def _set_buttons_state(self, state):
+        """Set the state of the save settings and run buttons.
+
+        Args:
+            state (list): The ttk state flags to set, e.g. ["disabled"]
+        """
+        self.btn_save_settings.state(state)
+        self.btn_run.state(state)
+
+    def _run_generator(self):
+        """Run the generator, then enable the buttons again.
+
+        Called in a background thread by _save_and_run.
+
+        Args:
+            None
+        """
+        try:
+            self.generator.run()
+        finally:
+            # Enable the buttons from the UI thread, unless the window has
+            # been closed in the meantime
+            try:
+                self.after(0, self._set_buttons_state, ["!disabled"])
+            except (RuntimeError, tk.TclError):
+                pass
 
     def _save_settings(self):
         """Save the settings to the config file.
@@ -724,48 +305,43 @@ class App(tk.Tk):
         """
         logger.info("Saving settings to config file")
 
-        # Get all the settings from the widgets
-        random = self.var_random.get()
-        random_max_occ = self.spn_random_max_occ.get()
-        random_prob = self.ent_random_prob.get()
-        random_message = self.ent_random_message.get()
-        stopped = self.var_stopped.get()
-        stopped_min = self.spn_stopped_min.get()
-        stopped_message = self.ent_stopped_message.get()
-        off = self.var_off.get()
-        off_min = self.spn_off_min.get()
-        off_message = self.ent_off_message.get()
-        max_safety_cars = self.ent_max_safety_cars.get()
-        start_minute = self.ent_start_minute.get()
-        end_minute = self.ent_end_minute.get()
-        min_time_between = self.ent_min_time_between.get()
-        laps_under_sc = self.ent_laps_under_sc.get()
-        wave_arounds = self.var_wave_arounds.get()
-        laps_before_wave_arounds = self.ent_laps_before_wave_arounds.get()
-
-        # Save the settings to the config file
-        self.settings["settings"]["random"] = str(random)
-        self.settings["settings"]["random_max_occ"] = str(random_max_occ)
-        self.settings["settings"]["random_prob"] = str(random_prob)
-        self.settings["settings"]["random_message"] = str(random_message)
-        self.settings["settings"]["stopped"] = str(stopped)
-        self.settings["settings"]["stopped_min"] = str(stopped_min)
-        self.settings["settings"]["stopped_message"] = str(stopped_message)
-        self.settings["settings"]["off"] = str(off)
-        self.settings["settings"]["off_min"] = str(off_min)
-        self.settings["settings"]["off_message"] = str(off_message)
-        self.settings["settings"]["max_safety_cars"] = str(max_safety_cars)
-        self.settings["settings"]["start_minute"] = str(start_minute)
-        self.settings["settings"]["end_minute"] = str(end_minute)
-        self.settings["settings"]["min_time_between"] = str(min_time_between)
-        self.settings["settings"]["laps_under_sc"] = str(laps_under_sc)
-        self.settings["settings"]["wave_arounds"] = str(wave_arounds)
-        self.settings["settings"]["laps_before_wave_arounds"] = str(
-            laps_before_wave_arounds
-        )
+        # Get all the settings from their variables, keeping the order of
+        # the file
+        current = dict(self.settings["settings"])
+        settings = current.copy()
+        for key, var in self.setting_vars.items():
+            settings[key] = var.get()
+
+        # Skip serializing and writing the file if nothing changed
+        if settings == current:
+            return
 
-        with open("settings.ini", "w") as configfile:
-            self.settings.write(configfile)
+        # Replace the settings section in one go
+        self.settings["settings"] = settings
+
+        # Serialize the settings in memory, then write them to a temporary
+        # file and swap it in, so settings.ini is never left half written
+        buffer = io.StringIO()
+        self.settings.write(buffer)
+        try:
+            with open("settings.ini.tmp", "w") as configfile:
+                configfile.write(buffer.getvalue())
+            os.replace("settings.ini.tmp", "settings.ini")
+        except OSError:
+            # Don't leave the temporary file behind, if it was created
+            try:
+                os.remove("settings.ini.tmp")
+            except OSError:
+                pass
+
+            # Put back the settings that are in the file, so the next save
+            # doesn't see them as unchanged and skip the write
+            self.settings["settings"] = current
+            raise
+
+        # Let a running generator pick up the new settings
+        if self.generator is not None:
+            self.generator.update_settings()
 
     def set_message(self, message):
         """Set the status label to a message.
@@ -774,5 +350,4 @@ class App(tk.Tk):
             message (str): The message to set the status label to.
         """
         logger.debug(f"Setting status label to: {message}")
-        self.lbl_status["text"] = message
-        self.update_idletasks()
\ No newline at end of file
+        self.lbl_status["text"] = message
\ No newline at end of file
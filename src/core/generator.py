@@ -22,6 +22,10 @@ class Generator:
         logger.info("Initializing safety car generator")
         self.master = master
 
+        # Copy of the settings, taken by the main window before the generator
+        # is run and updated whenever the settings are saved
+        self.settings = None
+
         # Variables to track safety car events
         logger.debug("Initializing safety car variables")
         self.ir_window = None
@@ -31,10 +35,27 @@ class Generator:
         self.total_random_sc_events = 0
         self.lap_at_sc = None
         self.current_lap_under_sc = None
+        self.random_check_chance = None
 
         # Create a shutdown event
         self.shutdown_event = threading.Event()
 
+    def update_settings(self):
+        """Copy the current settings from the main window.
+
+        Called by the main window on its own thread before the generator is
+        run and whenever the settings are saved, so saving while running takes
+        effect at the next check. Must not be called from the generator's
+        threads, as saving replaces the settings section while it's copied.
+
+        Args:
+            None
+        """
+        # Copy the settings into a plain dict, so the checks don't go through
+        # ConfigParser every second, and reset values derived from them
+        self.settings = dict(self.master.settings["settings"])
+        self.random_check_chance = None
+
     def _is_shutting_down(self):
         """ Returns True if shutdown_event event was triggered
         
@@ -52,12 +73,10 @@ class Generator:
         logger.debug("Checking random safety car event")
 
         # Get relevant settings from the settings file
-        enabled = self.master.settings["settings"]["random"]
-        chance = float(self.master.settings["settings"]["random_prob"])
-        max_occ = int(self.master.settings["settings"]["random_max_occ"])
-        start_minute = float(self.master.settings["settings"]["start_minute"])
-        end_minute = float(self.master.settings["settings"]["end_minute"])
-        message = self.master.settings["settings"]["random_message"]
+        enabled = self.settings["random"]
+        chance = float(self.settings["random_prob"])
+        max_occ = int(self.settings["random_max_occ"])
+        message = self.settings["random_message"]
 
         # If random events are disabled, return
         if enabled == "0":
@@ -74,12 +93,18 @@ class Generator:
         # Generate a random number between 0 and 1
         rng = random.random()
 
-        # Calculate the chance of triggering a safety car event this check
-        len_of_window = (end_minute - start_minute) * 60
-        chance = 1 - ((1 - chance) ** (1 / len_of_window))
+        # Calculate the chance of triggering a safety car event each check,
+        # once per copy of the settings since the window only changes with them
+        if self.random_check_chance is None:
+            start_minute = float(self.settings["start_minute"])
+            end_minute = float(self.settings["end_minute"])
+            len_of_window = (end_minute - start_minute) * 60
+            self.random_check_chance = 1 - (
+                (1 - chance) ** (1 / len_of_window)
+            )
 
         # If the random number is less than or equal to the chance, trigger
-        if rng <= chance:
+        if rng <= self.random_check_chance:
             self.total_random_sc_events += 1
             self._start_safety_car(message) 
 
@@ -92,9 +117,9 @@ class Generator:
         logger.debug("Checking stopped car safety car event")
 
         # Get relevant settings from the settings file
-        enabled = self.master.settings["settings"]["stopped"]
-        threshold = float(self.master.settings["settings"]["stopped_min"])
-        message = self.master.settings["settings"]["stopped_message"]
+        enabled = self.settings["stopped"]
+        threshold = float(self.settings["stopped_min"])
+        message = self.settings["stopped_message"]
 
         # If stopped car events are disabled, return
         if enabled == "0":
@@ -116,31 +141,14 @@ class Generator:
         if len(stopped_cars) >= len(self.drivers.current_drivers) - 1:
             stopped_cars = []
 
-        # For each stopped car, check if they're in pits, remove if so
-        cars_to_remove = []
-        for car in stopped_cars:
-            if self.drivers.current_drivers[car]["track_loc"] == 1:
-                cars_to_remove.append(car)
-            if self.drivers.current_drivers[car]["track_loc"] == 2:
-                cars_to_remove.append(car)
-        for car in cars_to_remove:
-            stopped_cars.remove(car)
-
-        # For each, check if not in world, remove if so
-        cars_to_remove = []
-        for car in stopped_cars:
-            if self.drivers.current_drivers[car]["track_loc"] == -1:
-                cars_to_remove.append(car)
-        for car in cars_to_remove:
-            stopped_cars.remove(car)
-
-        # For each, check if lap distance < 0, remove if so
-        cars_to_remove = []
-        for car in stopped_cars:
-            if self.drivers.current_drivers[car]["lap_distance"] < 0:
-                cars_to_remove.append(car)
-        for car in cars_to_remove:
-            stopped_cars.remove(car)
+        # Drop cars not in world (-1) or in the pits (1 and 2), and cars with
+        # a lap distance < 0, in a single pass
+        current_drivers = self.drivers.current_drivers
+        stopped_cars = [
+            car for car in stopped_cars
+            if current_drivers[car]["track_loc"] not in (-1, 1, 2)
+            and current_drivers[car]["lap_distance"] >= 0
+        ]
 
         # Trigger the safety car event if threshold is met
         if len(stopped_cars) >= threshold:
@@ -155,27 +163,19 @@ class Generator:
         logger.debug("Checking off track safety car event")
 
         # Get relevant settings from the settings file
-        enabled = self.master.settings["settings"]["off"]
-        threshold = float(self.master.settings["settings"]["off_min"])
-        message = self.master.settings["settings"]["off_message"]
+        enabled = self.settings["off"]
+        threshold = float(self.settings["off_min"])
+        message = self.settings["off_message"]
 
         # If off track events are disabled, return
         if enabled == "0":
             return
 
-        # Get the indices of the off track cars
-        off_track_cars = []
-        for i in range(len(self.drivers.current_drivers)):
-            if self.drivers.current_drivers[i]["track_loc"] == 0:
-                off_track_cars.append(i)
-
-        # For each off track car, check if lap distance < 0, remove if so
-        cars_to_remove = []
-        for car in off_track_cars:
-            if self.drivers.current_drivers[car]["lap_distance"] < 0:
-                cars_to_remove.append(car)
-        for car in cars_to_remove:
-            off_track_cars.remove(car)
+        # Get the indices of the off track cars with a valid lap distance
+        off_track_cars = [
+            i for i, driver in enumerate(self.drivers.current_drivers)
+            if driver["track_loc"] == 0 and driver["lap_distance"] >= 0
+        ]
 
         # Trigger the safety car event if threshold is met
         if len(off_track_cars) >= threshold:
@@ -231,10 +231,10 @@ class Generator:
         logger.debug("Starting safety car loop")
 
         # Get relevant settings from the settings file
-        start_minute = float(self.master.settings["settings"]["start_minute"])
-        end_minute = float(self.master.settings["settings"]["end_minute"])
-        max_events = int(self.master.settings["settings"]["max_safety_cars"])
-        min_time = float(self.master.settings["settings"]["min_time_between"])
+        start_minute = float(self.settings["start_minute"])
+        end_minute = float(self.settings["end_minute"])
+        max_events = int(self.settings["max_safety_cars"])
+        min_time = float(self.settings["min_time_between"])
 
         # Adjust start minute if < 3s to avoid triggering on standing start
         if start_minute < 0.05:
@@ -251,9 +251,10 @@ class Generator:
 
             logger.debug("Checking time")
 
-            # If it hasn't reached the start minute, wait
-            if time.time() - self.start_time < start_minute * 60:
-                time.sleep(1)
+            # If it hasn't reached the start minute, wait (at most 1 second)
+            time_to_start = start_minute * 60 - (time.time() - self.start_time)
+            if time_to_start > 0:
+                time.sleep(min(time_to_start, 1))
                 continue
 
             # If it has reached the end minute, break the loop
@@ -281,6 +282,22 @@ class Generator:
         # Shutdown the iRacing SDK after all safety car events are complete
         self.ir.shutdown()
 
+    def _send_chat_command(self, command):
+        """Open the chat in iRacing and send a chat command.
+
+        Args:
+            command: The chat command to type, without the trailing Enter
+        """
+        logger.debug(f"Sending chat command: {command}")
+
+        # Focus the iRacing window and open the chat
+        self.ir_window.set_focus()
+        self.ir.chat_command(1)
+
+        # Give the chat box time to open, then type the command in one go
+        time.sleep(0.5)
+        self.ir_window.type_keys(f"{command}{{ENTER}}", with_spaces=True)
+
     def _send_pacelaps(self):
         """Send a pacelaps chat command to iRacing.
         
@@ -291,9 +308,7 @@ class Generator:
             True if pace laps are done, False otherwise
         """
         # Get relevant settings from the settings file
-        laps_under_sc = int(
-            self.master.settings["settings"]["laps_under_sc"]
-        )
+        laps_under_sc = int(self.settings["laps_under_sc"])
 
         # If laps under safety car is 0, return
         logger.debug("Laps under safety car set too low, skipping command")
@@ -320,13 +335,7 @@ class Generator:
             # If any lead car is at 50%, send the pacelaps command
             if max(lead_dist) >= 0.5:
                 logger.info("Sending pacelaps command")
-                self.ir_window.set_focus()
-                self.ir.chat_command(1)
-                time.sleep(0.5)
-                self.ir_window.type_keys(
-                    f"!p {laps_under_sc - 1}{{ENTER}}",
-                    with_spaces=True
-                )
+                self._send_chat_command(f"!p {laps_under_sc - 1}")
 
                 # Return True when pace laps are done
                 return True
@@ -344,10 +353,8 @@ class Generator:
             True if wave arounds are done, False otherwise
         """
         # Get relevant settings from the settings file
-        wave_arounds = self.master.settings["settings"]["wave_arounds"]
-        laps_before = int(
-            self.master.settings["settings"]["laps_before_wave_arounds"]
-        )
+        wave_arounds = self.settings["wave_arounds"]
+        laps_before = int(self.settings["laps_before_wave_arounds"])
 
         # If immediate waveby is disabled, return True (no wave arounds)
         if wave_arounds == "0":
@@ -380,18 +387,13 @@ class Generator:
         )
         drivers = tuple(drivers)
 
-        # Get the highest started lap for each class
-        highest_lap = {}
-        for class_id in class_ids:
-            # Get the highest lap and track position for the current class
-            max_lap = (0, 0)
-            for driver in drivers:
-                if driver[2] == class_id:
-                    if driver[0] > max_lap[0]:
-                        max_lap = (driver[0], driver[1])
-
-            # Add the highest lap to the dictionary
-            highest_lap[class_id] = max_lap
+        # Get the highest started lap and its track position for each class,
+        # bucketing drivers by class in a single pass
+        highest_lap = {class_id: (0, 0) for class_id in class_ids}
+        for driver in drivers:
+            max_lap = highest_lap.get(driver[2])
+            if max_lap is not None and driver[0] > max_lap[0]:
+                highest_lap[driver[2]] = (driver[0], driver[1])
 
         # Create an empty list of cars to wave around
         cars_to_wave = []
@@ -426,12 +428,7 @@ class Generator:
         if len(cars_to_wave) > 0:
             for car in cars_to_wave:
                 logger.info(f"Sending wave around command for car {car}")
-                self.ir_window.set_focus()
-                self.ir.chat_command(1)
-                time.sleep(0.5)
-                self.ir_window.type_keys(
-                    f"!w {car}{{ENTER}}", with_spaces=True
-                )
+                self._send_chat_command(f"!w {car}")
 
         # Return True when wave arounds are done
         return True
@@ -445,10 +442,7 @@ class Generator:
         logger.info("Deploying safety car")
 
         # Send yellow flag chat command
-        self.ir_window.set_focus()
-        self.ir.chat_command(1)
-        time.sleep(0.5)
-        self.ir_window.type_keys(f"!y {message}{{ENTER}}", with_spaces=True)
+        self._send_chat_command(f"!y {message}")
 
         # Set the UI message
         self.master.set_message(
@@ -533,10 +527,13 @@ class Generator:
             "Connected to iRacing\nWaiting for green flag..."
         )
 
+        # Look up the green flag mask once, since the loop polls at 60 Hz
+        green_flag = irsdk.Flags.green
+
         # Loop until the green flag is displayed
         while True:
             # Check if the green flag is displayed
-            if self.ir["SessionFlags"] & irsdk.Flags.green:
+            if self.ir["SessionFlags"] & green_flag:
                 # Set the start time if it hasn't been set yet
                 if self.start_time is None:
                     self.start_time = time.time()
@@ -553,8 +550,8 @@ class Generator:
             if self._is_shutting_down():
                 break
 
-            # Wait 1 second before checking again
-            time.sleep(1)
+            # Wait one iRacing SDK tick (60 Hz) before checking again
+            time.sleep(1 / 60)
 
     def generator_thread_excepthook(self, args):
         logger.critical("Uncaught exception:", exc_info=args)
@@ -4,25 +4,44 @@ tested with Python27 and Python34  by  vegaseat  09sep2014
 www.daniweb.com/programming/software-development/code/484591/a-tooltip-class-for-tkinter
 
 Modified to include a delay time by Victor Zaccardo, 25mar16
+
+Modified to show the tooltips of all widgets from one set of bindings and one
+reused tooltip window
 """
 import tkinter as tk
 
-class CreateToolTip(object):
+class ToolTipManager(object):
     """
-    create a tooltip for a given widget
+    show tooltips for registered widgets of a window
     """
-    def __init__(self, widget, text='widget info'):
+    # one of these is kept per window, its widgets are only kept by name
+    __slots__ = ("root", "waittime", "wraplength", "texts", "widget", "id",
+                 "tw", "label")
+
+    def __init__(self, root):
+        self.root = root
         self.waittime = 500     #miliseconds
         self.wraplength = 180   #pixels
-        self.widget = widget
-        self.text = text
-        self.widget.bind("<Enter>", self.enter)
-        self.widget.bind("<Leave>", self.leave)
-        self.widget.bind("<ButtonPress>", self.leave)
+        self.texts = {}
+        self.widget = None
         self.id = None
         self.tw = None
+        self.label = None
+        # bind once for every widget, instead of once per widget
+        self.root.bind_all("<Enter>", self.enter, add="+")
+        self.root.bind_all("<Leave>", self.leave, add="+")
+        self.root.bind_all("<ButtonPress>", self.leave, add="+")
+
+    def register(self, text, *widgets):
+        # text may be a callable, so it is only looked up once shown, and is
+        # shared by all the widgets given
+        for widget in widgets:
+            self.texts[str(widget)] = text
 
     def enter(self, event=None):
+        if str(event.widget) not in self.texts:
+            return
+        self.widget = event.widget
         self.schedule()
 
     def leave(self, event=None):
@@ -31,31 +50,37 @@ class CreateToolTip(object):
 
     def schedule(self):
         self.unschedule()
-        self.id = self.widget.after(self.waittime, self.showtip)
+        self.id = self.root.after(self.waittime, self.showtip)
 
     def unschedule(self):
         id = self.id
         self.id = None
         if id:
-            self.widget.after_cancel(id)
+            self.root.after_cancel(id)
 
     def showtip(self, event=None):
+        widget = self.widget
+        text = self.texts[str(widget)]
+        text = text() if callable(text) else text
         x = y = 0
-        x, y, cx, cy = self.widget.bbox("insert")
-        x += self.widget.winfo_rootx() + 25
-        y += self.widget.winfo_rooty() + 20
-        # creates a toplevel window
-        self.tw = tk.Toplevel(self.widget)
-        # Leaves only the label and removes the app window
-        self.tw.wm_overrideredirect(True)
+        x, y, cx, cy = widget.bbox("insert")
+        x += widget.winfo_rootx() + 25
+        y += widget.winfo_rooty() + 20
+        if self.tw is None:
+            # creates the toplevel window once, it is hidden between tooltips
+            self.tw = tk.Toplevel(self.root)
+            # Leaves only the label and removes the app window
+            self.tw.wm_overrideredirect(True)
+            self.label = tk.Label(self.tw, justify='left',
+                           background="#ffffff", relief='solid', borderwidth=1,
+                           wraplength = self.wraplength)
+            self.label.pack(ipadx=1)
+        # a missing text would leave the previous widget's text in place, as
+        # tkinter drops options set to None, so show it as empty instead
+        self.label["text"] = text or ""
         self.tw.wm_geometry("+%d+%d" % (x, y))
-        label = tk.Label(self.tw, text=self.text, justify='left',
-                       background="#ffffff", relief='solid', borderwidth=1,
-                       wraplength = self.wraplength)
-        label.pack(ipadx=1)
+        self.tw.deiconify()
 
     def hidetip(self):
-        tw = self.tw
-        self.tw= None
-        if tw:
-            tw.destroy()
\ No newline at end of file
+        if self.tw is not None:
+            self.tw.withdraw()
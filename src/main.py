@@ -1,8 +1,11 @@
 from datetime import datetime
+import ctypes
+import gc
 import logging
 import logging.config
 import json
 import os
+import sys
 
 from core.app import App
 
@@ -29,14 +32,38 @@ def setup_logging():
     # Log the start of the program
     logger.info("Program started")
 
+def set_dpi_awareness():
+    """Make the process DPI aware before any window is created.
+
+    pywinauto does this when it is imported, which now only happens once the
+    generator is loaded. Doing it first keeps the window sharp and stops it
+    changing size when pywinauto is imported later.
+    """
+    if sys.platform != "win32":
+        return
+
+    # Per monitor DPI aware, as pywinauto sets it
+    try:
+        ctypes.windll.shcore.SetProcessDpiAwareness(2)
+    except (AttributeError, OSError):
+        logging.warning("Could not set DPI awareness", exc_info=True)
+
 def main():
     """Main function for the safety car generator."""
     # Set up logging
     setup_logging()
 
+    # Set DPI awareness before the window is created
+    set_dpi_awareness()
+
     # Try to create and run the app, and log exceptions
     try:
         app = App()
+
+        # Move the long-lived window objects out of the collected generations,
+        # so collections while running don't rescan them
+        gc.freeze()
+
         app.mainloop()
     except Exception as e:
         logging.exception("A fatal error has occurred")